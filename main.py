@@ -17,31 +17,53 @@ The core functionality includes:
 
 from PIL import Image, ImageDraw
 import math
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
-class Axes:
-    """Represents the three axes in the triangular coordinate system."""
-
-    def __init__(self):
-        self._axes = ['x', 'y', 'z']
-
-    def __iter__(self):
-        return iter(self._axes)
-
-    def __len__(self):
-        return len(self._axes)
-
-    def __contains__(self, axis):
-        return axis in self._axes
-
-    def __getitem__(self, item):
-        return self._axes[item]
+# Projection constants for converting triangular to Cartesian coordinates,
+# computed once instead of per call.
+_TG30 = math.tan(math.pi / 6.0)
+_INV_2TG30 = 1.0 / (2.0 * _TG30)
+
+# Transformation tables mapping angle/axis to an index permutation and signs
+# applied to the (x, y, z) coordinate triple, replacing per-call match/case
+# dispatch in the hot paths.
+_ROTATION = {
+    60: ((1, 2, 0), (-1, -1, -1)),
+    120: ((2, 0, 1), (1, 1, 1)),
+    180: ((0, 1, 2), (-1, -1, -1)),
+    240: ((1, 2, 0), (1, 1, 1)),
+    300: ((2, 0, 1), (-1, -1, -1)),
+}
+_REFLECTION = {
+    'x': ((0, 2, 1), (-1, -1, -1)),
+    'y': ((2, 1, 0), (-1, -1, -1)),
+    'z': ((1, 0, 2), (-1, -1, -1)),
+}
+_SHIFT = {
+    'x': (0, 1, -1),
+    'y': (-1, 0, 1),
+    'z': (1, -1, 0),
+}
+_AXES = ('x', 'y', 'z')
+_AXIS_IDX = {'x': 0, 'y': 1, 'z': 2}
+
+# Neighbour coordinate deltas per axis, indexed by triangle orientation
+# ((look + 1) >> 1 maps look = -1/+1 to 0/1), so finding a neighbour is a
+# table lookup plus three additions with no branching on look.
+_NEIGHBOUR_DELTA = {
+    'x': ((0, 1, 1), (0, -1, -1)),
+    'y': ((1, 0, 1), (-1, 0, -1)),
+    'z': ((1, 1, 0), (-1, -1, 0)),
+}
 
 
 class Triangle:
     """Represents a single equilateral triangle in the triangular grid."""
 
+    __slots__ = ('x', 'y', 'z')
+
     def __init__(self, x, y, z):
         self.x = x
         self.y = y
@@ -73,16 +95,11 @@ class Triangle:
 
     def get_neighbour_coords(self, axis):
         """Returns coordinates of the neighboring triangle along the specified axis."""
-        look = self.x + self.y + self.z
-        match axis:
-            case 'x':
-                return self.x, self.y - look, self.z - look
-            case 'y':
-                return self.x - look, self.y, self.z - look
-            case 'z':
-                return self.x - look, self.y - look, self.z
-            case _:
-                return None
+        deltas = _NEIGHBOUR_DELTA.get(axis)
+        if deltas is None:
+            return None
+        dx, dy, dz = deltas[(self.x + self.y + self.z + 1) >> 1]
+        return self.x + dx, self.y + dy, self.z + dz
 
     def get_neighbour(self, axis):
         """Returns the neighboring triangle along the specified axis."""
@@ -91,19 +108,12 @@ class Triangle:
 
     def get_rotated_coords(self, angle):
         """Returns coordinates after rotation by the specified angle (multiple of 60 degrees)."""
-        match angle:
-            case 60:
-                return -self.y, -self.z, -self.x
-            case 120:
-                return self.z, self.x, self.y
-            case 180:
-                return -self.x, -self.y, -self.z
-            case 240:
-                return self.y, self.z, self.x
-            case 300:
-                return -self.z, -self.x, -self.y
-            case _:
-                return None
+        entry = _ROTATION.get(angle)
+        if entry is None:
+            return None
+        perm, signs = entry
+        coords = (self.x, self.y, self.z)
+        return signs[0] * coords[perm[0]], signs[1] * coords[perm[1]], signs[2] * coords[perm[2]]
 
     def get_rotated(self, angle):
         """Returns a new triangle rotated by the specified angle."""
@@ -112,15 +122,12 @@ class Triangle:
 
     def get_reflected_coords(self, axis):
         """Returns coordinates after reflection over the specified axis."""
-        match axis:
-            case 'x':
-                return -self.x, -self.z, -self.y
-            case 'y':
-                return -self.z, -self.y, -self.x
-            case 'z':
-                return -self.y, -self.x, -self.z
-            case _:
-                return None
+        entry = _REFLECTION.get(axis)
+        if entry is None:
+            return None
+        perm, signs = entry
+        coords = (self.x, self.y, self.z)
+        return signs[0] * coords[perm[0]], signs[1] * coords[perm[1]], signs[2] * coords[perm[2]]
 
     def get_reflected(self, axis):
         """Returns a new triangle reflected over the specified axis."""
@@ -129,15 +136,10 @@ class Triangle:
 
     def get_shifted_coords(self, shift, axis):
         """Returns coordinates after shifting along the specified axis."""
-        match axis:
-            case 'x':
-                return self.x, self.y + shift, self.z - shift
-            case 'y':
-                return self.x - shift, self.y, self.z + shift
-            case 'z':
-                return self.x + shift, self.y - shift, self.z
-            case _:
-                return None
+        vec = _SHIFT.get(axis)
+        if vec is None:
+            return None
+        return self.x + shift * vec[0], self.y + shift * vec[1], self.z + shift * vec[2]
 
     def get_shifted(self, shift, axis):
         """Returns a new triangle shifted along the specified axis."""
@@ -150,33 +152,32 @@ class Triangle:
 
     def get_cartesian_coords(self, axis='all'):
         """Converts triangular coordinates to Cartesian coordinates for drawing."""
-        tg30 = math.tan(math.pi / 6.0)
         match axis:
             case 'x':
-                x1 = self.x / (2.0 * tg30)
+                x1 = self.x * _INV_2TG30
                 y1 = self.x / 2.0 + self.y
                 x2 = x1
                 y2 = -self.x / 2.0 - self.z
                 return (x1, y1), (x2, y2)
             case 'y':
-                x1 = self.x / (2.0 * tg30)
+                x1 = self.x * _INV_2TG30
                 y1 = self.x / 2.0 + self.y
-                x2 = -(self.z + self.y) / (2.0 * tg30)
-                y2 = x2 * tg30 + self.y
+                x2 = -(self.z + self.y) * _INV_2TG30
+                y2 = x2 * _TG30 + self.y
                 return (x1, y1), (x2, y2)
             case 'z':
-                x1 = self.x / (2.0 * tg30)
+                x1 = self.x * _INV_2TG30
                 y1 = -self.x / 2.0 - self.z
-                x2 = -(self.z + self.y) / (2.0 * tg30)
-                y2 = -x2 * tg30 - self.z
+                x2 = -(self.z + self.y) * _INV_2TG30
+                y2 = -x2 * _TG30 - self.z
                 return (x1, y1), (x2, y2)
             case 'all':
-                x1 = self.x / (2.0 * tg30)
+                x1 = self.x * _INV_2TG30
                 y1 = self.x / 2.0 + self.y
                 x2 = x1
                 y2 = -self.x / 2.0 - self.z
-                x3 = -(self.z + self.y) / (2.0 * tg30)
-                y3 = x3 * tg30 + self.y
+                x3 = -(self.z + self.y) * _INV_2TG30
+                y3 = x3 * _TG30 + self.y
                 return (x1, y1), (x2, y2), (x3, y3)
             case _:
                 return None
@@ -185,17 +186,20 @@ class Triangle:
 class Pattern:
     """Represents a collection of triangles forming a pattern."""
 
+    __slots__ = ('_triangles', '_canonical_key')
+
     def __init__(self):
-        self._triangles = []
+        self._triangles = set()
+        self._canonical_key = None
 
     def __iter__(self):
-        return iter(self._triangles)
+        return (Triangle(x, y, z) for x, y, z in self._triangles)
 
     def __len__(self):
         return len(self._triangles)
 
     def __contains__(self, item):
-        return item in self._triangles
+        return (item.x, item.y, item.z) in self._triangles
 
     def __eq__(self, other):
         """Checks if two patterns are equivalent under rotation/reflection."""
@@ -209,17 +213,7 @@ class Pattern:
                     aligned_other = rotated_other.get_aligned('z')
                 else:
                     aligned_other = rotated_other.get_reflected('z').get_aligned('z')
-                are_equal = True
-                for triangle in aligned_self:
-                    if triangle not in aligned_other:
-                        are_equal = False
-                        break
-                if are_equal:
-                    for triangle in aligned_other:
-                        if triangle not in aligned_self:
-                            are_equal = False
-                            break
-                if are_equal:
+                if aligned_self._triangles == aligned_other._triangles:
                     found_equal = True
                     break
             if found_equal:
@@ -231,67 +225,125 @@ class Pattern:
 
     def add_triangle(self, triangle):
         """Adds a triangle to the pattern."""
-        self._triangles.append(triangle)
+        self._triangles.add((triangle.x, triangle.y, triangle.z))
+        self._canonical_key = None
+
+    def canonical_key(self):
+        """
+        Returns a hashable key identifying the pattern up to rotation/reflection.
+        Equivalent patterns produce the same key, so uniqueness checks reduce
+        to a single hash lookup instead of pairwise equality tests.
+
+        The 12 rotation/reflection variants are computed with inline integer
+        arithmetic on the coordinate tuples; aligning along z collapses the
+        two shifts of get_aligned into one pass using max(x) and min(y).
+        Each aligned triple is packed into a single int (three 8-bit fields,
+        two's complement), so the key is a tuple of ints that sorts, hashes
+        and compares without per-element tuple overhead. The result is
+        cached until the pattern is mutated.
+        """
+        if self._canonical_key is not None:
+            return self._canonical_key
+        variants = []
+        # The transforms are bijections over a set, so the variants stay
+        # duplicate-free as plain lists and skip per-element set hashing
+        coords = self._triangles
+        for _ in range(6):
+            coords = [(-y, -z, -x) for x, y, z in coords]
+            reflected = [(-y, -x, -z) for x, y, z in coords]
+            for variant in (coords, reflected):
+                max_x = max(x for x, _, _ in variant)
+                min_y = min(y for _, y, _ in variant)
+                shift = max_x + min_y
+                variants.append(tuple(sorted(
+                    (((x - max_x) & 0xFF) << 16)
+                    | (((y - min_y) & 0xFF) << 8)
+                    | ((z + shift) & 0xFF)
+                    for x, y, z in variant)))
+        self._canonical_key = min(variants)
+        return self._canonical_key
 
     def get_min_coord(self, axis):
         """Returns the minimum coordinate value along the specified axis."""
-        curr_min = None
-        for triangle in self._triangles:
-            if curr_min is None:
-                curr_min = triangle.get_coord(axis)
-            elif curr_min > triangle.get_coord(axis):
-                curr_min = triangle.get_coord(axis)
-        return curr_min
+        idx = _AXIS_IDX.get(axis)
+        if idx is None or not self._triangles:
+            return None
+        return min(coords[idx] for coords in self._triangles)
 
     def get_max_coord(self, axis):
         """Returns the maximum coordinate value along the specified axis."""
-        curr_max = None
-        for triangle in self._triangles:
-            if curr_max is None:
-                curr_max = triangle.get_coord(axis)
-            elif curr_max < triangle.get_coord(axis):
-                curr_max = triangle.get_coord(axis)
-        return curr_max
+        idx = _AXIS_IDX.get(axis)
+        if idx is None or not self._triangles:
+            return None
+        return max(coords[idx] for coords in self._triangles)
 
     def get_shifted(self, shift, axis):
         """Returns a new pattern shifted along the specified axis."""
         shifted = Pattern()
-        for triangle in self:
-            shifted.add_triangle(triangle.get_shifted(shift, axis))
+        match axis:
+            case 'x':
+                shifted._triangles = {(x, y + shift, z - shift) for x, y, z in self._triangles}
+            case 'y':
+                shifted._triangles = {(x - shift, y, z + shift) for x, y, z in self._triangles}
+            case 'z':
+                shifted._triangles = {(x + shift, y - shift, z) for x, y, z in self._triangles}
         return shifted
 
     def get_rotated(self, angle):
         """Returns a new pattern rotated by the specified angle."""
         rotated = Pattern()
-        for triangle in self:
-            rotated.add_triangle(triangle.get_rotated(angle))
+        match angle:
+            case 60:
+                rotated._triangles = {(-y, -z, -x) for x, y, z in self._triangles}
+            case 120:
+                rotated._triangles = {(z, x, y) for x, y, z in self._triangles}
+            case 180:
+                rotated._triangles = {(-x, -y, -z) for x, y, z in self._triangles}
+            case 240:
+                rotated._triangles = {(y, z, x) for x, y, z in self._triangles}
+            case 300:
+                rotated._triangles = {(-z, -x, -y) for x, y, z in self._triangles}
         return rotated
 
     def get_reflected(self, axis):
         """Returns a new pattern reflected over the specified axis."""
         reflected = Pattern()
-        for triangle in self:
-            reflected.add_triangle(triangle.get_reflected(axis))
+        match axis:
+            case 'x':
+                reflected._triangles = {(-x, -z, -y) for x, y, z in self._triangles}
+            case 'y':
+                reflected._triangles = {(-z, -y, -x) for x, y, z in self._triangles}
+            case 'z':
+                reflected._triangles = {(-y, -x, -z) for x, y, z in self._triangles}
         return reflected
 
     def get_aligned(self, free_axis):
-        """Aligns the pattern along the specified free axis."""
+        """
+        Aligns the pattern along the specified free axis.
+
+        Both alignment shifts are linear, so they are combined into one
+        per-triangle transform, producing a single new pattern instead of two.
+        """
+        aligned = Pattern()
         match free_axis:
             case 'x':
-                max_coord = self.get_max_coord('y')
-                aligned = self.get_shifted(max_coord, 'z')
-                min_coord = aligned.get_min_coord('z')
-                aligned = aligned.get_shifted(-min_coord, 'y')
+                max_y = self.get_max_coord('y')
+                min_z = self.get_min_coord('z')
+                shift = max_y + min_z
+                aligned._triangles = {(x + shift, y - max_y, z - min_z)
+                                      for x, y, z in self._triangles}
             case 'y':
-                max_coord = self.get_max_coord('z')
-                aligned = self.get_shifted(max_coord, 'x')
-                min_coord = aligned.get_min_coord('x')
-                aligned = aligned.get_shifted(-min_coord, 'z')
+                max_z = self.get_max_coord('z')
+                min_x = self.get_min_coord('x')
+                shift = max_z + min_x
+                aligned._triangles = {(x - min_x, y + shift, z - max_z)
+                                      for x, y, z in self._triangles}
             case 'z':
-                max_coord = self.get_max_coord('x')
-                aligned = self.get_shifted(max_coord, 'y')
-                min_coord = aligned.get_min_coord('y')
-                aligned = aligned.get_shifted(-min_coord, 'x')
+                max_x = self.get_max_coord('x')
+                min_y = self.get_min_coord('y')
+                shift = max_x + min_y
+                aligned._triangles = {(x - max_x, y - min_y, z + shift)
+                                      for x, y, z in self._triangles}
             case _:
                 aligned = None
         return aligned
@@ -311,34 +363,35 @@ class Pattern:
     def get_copy(self):
         """Returns a deep copy of the pattern."""
         pattern_copy = Pattern()
-        for triangle in self:
-            pattern_copy.add_triangle(triangle.get_copy())
+        pattern_copy._triangles = set(self._triangles)
         return pattern_copy
 
     def create_image(self, show_axes=True, show_grid=True):
         """Creates an image representation of the pattern."""
-        tg30 = math.tan(math.pi / 6.0)
-        axes = Axes()
-
-        # Calculate the bounding radius for the image
-        lines = []
+        # Compute all edge endpoints in one pass over the coordinate tuples.
+        # The three triangle vertices are shared between the axis edges, so
+        # they are projected once instead of once per axis, and boundary
+        # edges are detected by probing the neighbour tuple in the set.
+        normal_lines = []
+        bold_lines = []
         radius = 0
-        for triangle in self:
-            for axis in axes:
-                line = triangle.get_cartesian_coords(axis)
-                if abs(line[0][0]) > radius:
-                    radius = abs(line[0][0])
-                if abs(line[1][0]) > radius:
-                    radius = abs(line[1][0])
-                if abs(line[0][1]) > radius:
-                    radius = abs(line[0][1])
-                if abs(line[1][1]) > radius:
-                    radius = abs(line[1][1])
-                neighbour = triangle.get_neighbour(axis)
-                if neighbour in self:
-                    lines.append([line, 'normal'])
+        triangles = self._triangles
+        for x, y, z in triangles:
+            ax = x * _INV_2TG30
+            cx = -(y + z) * _INV_2TG30
+            point_a = (ax, x / 2.0 + y)
+            point_b = (ax, -x / 2.0 - z)
+            point_c = (cx, cx * _TG30 + y)
+            radius = max(radius, abs(ax), abs(cx),
+                         abs(point_a[1]), abs(point_b[1]), abs(point_c[1]))
+            look = x + y + z
+            for line, neighbour in (((point_a, point_b), (x, y - look, z - look)),
+                                    ((point_a, point_c), (x - look, y, z - look)),
+                                    ((point_b, point_c), (x - look, y - look, z))):
+                if neighbour in triangles:
+                    normal_lines.append(line)
                 else:
-                    lines.append([line, 'bold'])
+                    bold_lines.append(line)
 
         # Set up image dimensions
         x_min = -int(radius) - 1
@@ -350,111 +403,163 @@ class Pattern:
         img_width = (x_max - x_min) * scale + 20
         img_height = (y_max - y_min) * scale + 20
 
-        img = Image.new('RGB', (img_width, img_height), color='white')
+        # Grid and axes only depend on the extent, so the background is
+        # rendered once per extent and copied for each pattern
+        img = _get_background(x_min, show_axes, show_grid).copy()
         draw = ImageDraw.Draw(img)
 
         def to_real(_x, _y):
             """Converts coordinates to image pixel coordinates."""
             return _x * scale + img_width / 2, img_height / 2 - _y * scale
 
-        # Draw grid lines if enabled
-        if show_grid:
-            for x in range(int(x_min * 2.0 * tg30), int(x_max * 2.0 * tg30) + 1):
-                x1, y1 = to_real(x / (2.0 * tg30), y_min)
-                x2, y2 = to_real(x / (2.0 * tg30), y_max)
-                draw.line([x1, y1, x2, y2], fill='lightgray', width=1)
-            for y in range(y_max - int(x_min * tg30), y_min - int(x_max * tg30), -1):
-                x1 = x_min
-                y1 = y + x_min * tg30
-                x2 = x_max
-                y2 = y1 + (x_max - x_min) * tg30
-                if y1 < y_min:
-                    x1 = x_min + (y_min - y1) / tg30
-                    y1 = y_min
-                if y2 > y_max:
-                    x2 = x_max - (y2 - y_max) / tg30
-                    y2 = y_max
-                x3 = x_max - x1 + x_min
-                x4 = x_max - x2 + x_min
-                x1, y1 = to_real(x1, y1)
-                x2, y2 = to_real(x2, y2)
-                x3, _ = to_real(x3, y1)
-                x4, _ = to_real(x4, y2)
-                draw.line([x1, y1, x2, y2], fill='lightgray', width=1)
-                draw.line([x3, y1, x4, y2], fill='lightgray', width=1)
-
-        # Draw axes if enabled
-        if show_axes:
-            x0 = 0
-            y0 = 0
-            x1 = 0
-            y1 = y_max
-            x2 = x_min
-            y2 = x_min * tg30
-            x3 = x_max
-            y3 = -x_max * tg30
-            x0, y0 = to_real(x0, y0)
-            x1, y1 = to_real(x1, y1)
-            x2, y2 = to_real(x2, y2)
-            x3, y3 = to_real(x3, y3)
-            draw.line([x0, y0, x1, y1], fill='gray', width=1)
-            draw.line([x0, y0, x2, y2], fill='gray', width=1)
-            draw.line([x0, y0, x3, y3], fill='gray', width=1)
-
-        # Draw all triangle edges
-        for line in lines:
-            x1, y1 = to_real(line[0][0][0], line[0][0][1])
-            x2, y2 = to_real(line[0][1][0], line[0][1][1])
-            if line[1] == 'bold':
-                draw.line([x1, y1, x2, y2], fill='black', width=4)
-            else:
-                draw.line([x1, y1, x2, y2], fill='black', width=1)
+        # Draw all triangle edges, grouped by width
+        for (p1x, p1y), (p2x, p2y) in normal_lines:
+            x1, y1 = to_real(p1x, p1y)
+            x2, y2 = to_real(p2x, p2y)
+            draw.line([x1, y1, x2, y2], fill='black', width=1)
+        for (p1x, p1y), (p2x, p2y) in bold_lines:
+            x1, y1 = to_real(p1x, p1y)
+            x2, y2 = to_real(p2x, p2y)
+            draw.line([x1, y1, x2, y2], fill='black', width=4)
 
         return img
 
-    def dump_to_file(self, file_path):
+    def dump_to_file(self, file_path, show_axes=True, show_grid=True):
         """Saves the pattern image to a file."""
-        img = self.create_image()
+        img = self.create_image(show_axes, show_grid)
         img.save(file_path)
 
 
+_background_cache = {}
+
+
+def _get_background(x_min, show_axes, show_grid):
+    """
+    Returns the background image (grid lines and axes) for the given extent.
+    Backgrounds are identical for all patterns sharing a bounding box, so
+    they are cached and reused instead of redrawn per pattern.
+    """
+    key = (x_min, show_axes, show_grid)
+    background = _background_cache.get(key)
+    if background is not None:
+        return background
+
+    y_min = x_min
+    x_max = -x_min
+    y_max = x_max
+    scale = 200
+
+    img_width = (x_max - x_min) * scale + 20
+    img_height = (y_max - y_min) * scale + 20
+
+    img = Image.new('RGB', (img_width, img_height), color='white')
+    draw = ImageDraw.Draw(img)
+
+    def to_real(_x, _y):
+        """Converts coordinates to image pixel coordinates."""
+        return _x * scale + img_width / 2, img_height / 2 - _y * scale
+
+    # Draw grid lines if enabled
+    if show_grid:
+        for x in range(int(x_min * 2.0 * _TG30), int(x_max * 2.0 * _TG30) + 1):
+            x1, y1 = to_real(x * _INV_2TG30, y_min)
+            x2, y2 = to_real(x * _INV_2TG30, y_max)
+            draw.line([x1, y1, x2, y2], fill='lightgray', width=1)
+        for y in range(y_max - int(x_min * _TG30), y_min - int(x_max * _TG30), -1):
+            x1 = x_min
+            y1 = y + x_min * _TG30
+            x2 = x_max
+            y2 = y1 + (x_max - x_min) * _TG30
+            if y1 < y_min:
+                x1 = x_min + (y_min - y1) / _TG30
+                y1 = y_min
+            if y2 > y_max:
+                x2 = x_max - (y2 - y_max) / _TG30
+                y2 = y_max
+            x3 = x_max - x1 + x_min
+            x4 = x_max - x2 + x_min
+            x1, y1 = to_real(x1, y1)
+            x2, y2 = to_real(x2, y2)
+            x3, _ = to_real(x3, y1)
+            x4, _ = to_real(x4, y2)
+            draw.line([x1, y1, x2, y2], fill='lightgray', width=1)
+            draw.line([x3, y1, x4, y2], fill='lightgray', width=1)
+
+    # Draw axes if enabled
+    if show_axes:
+        x0 = 0
+        y0 = 0
+        x1 = 0
+        y1 = y_max
+        x2 = x_min
+        y2 = x_min * _TG30
+        x3 = x_max
+        y3 = -x_max * _TG30
+        x0, y0 = to_real(x0, y0)
+        x1, y1 = to_real(x1, y1)
+        x2, y2 = to_real(x2, y2)
+        x3, y3 = to_real(x3, y3)
+        draw.line([x0, y0, x1, y1], fill='gray', width=1)
+        draw.line([x0, y0, x2, y2], fill='gray', width=1)
+        draw.line([x0, y0, x3, y3], fill='gray', width=1)
+
+    _background_cache[key] = img
+    return img
+
+
 def generate_patterns(patterns, triangles_to_add, sketch=None):
     """
-    Recursively generates all unique patterns with the specified number of triangles.
-    Patterns that are rotations or reflections of each other are considered identical.
+    Generates all unique patterns with the specified number of triangles.
+    Patterns that are rotations or reflections of each other are considered
+    identical. The search runs depth-first over an explicit stack of
+    (sketch, remaining) pairs, so it is not bound by the recursion limit.
     """
-    axes = Axes()
     if sketch is None:
         # Initialize with a single triangle
         sketch = Pattern()
-        triangle = Triangle(0, 1, 0)
-        sketch.add_triangle(triangle)
-        if triangles_to_add > 1:
-            generate_patterns(patterns, triangles_to_add - 1, sketch)
-        else:
-            patterns.append(sketch)
+        sketch.add_triangle(Triangle(0, 1, 0))
+    if triangles_to_add <= 1:
+        patterns.append(sketch)
         return
 
-    # Try adding neighbors to each existing triangle
-    for triangle in sketch:
-        for axis in axes:
-            neighbour = triangle.get_neighbour(axis)
-            if neighbour in sketch:
-                continue
-            new_sketch = sketch.get_copy()
-            new_sketch.add_triangle(neighbour)
-            if triangles_to_add > 1:
-                generate_patterns(patterns, triangles_to_add - 1, new_sketch)
-            else:
-                # Check if this is a new unique pattern
-                found_new_pattern = True
-                for pattern in patterns:
-                    if pattern == new_sketch:
-                        found_new_pattern = False
-                        break
-                if found_new_pattern:
-                    patterns.append(new_sketch.get_centered())
-                    return
+    seen_keys = set()
+    visited = {}
+    stack = [(sketch, triangles_to_add - 1)]
+    while stack:
+        sketch, remaining = stack.pop()
+
+        # Skip partial sketches whose canonical form was already expanded
+        # at this depth or deeper
+        key = sketch.canonical_key()
+        if visited.get(key, -1) >= remaining:
+            continue
+        visited[key] = remaining
+
+        # Try adding neighbors to each existing triangle; neighbour coordinates
+        # are computed inline on the tuples to avoid allocating a Triangle per probe
+        triangles = sketch._triangles
+        for x, y, z in triangles:
+            look = x + y + z
+            for neighbour in ((x, y - look, z - look),
+                              (x - look, y, z - look),
+                              (x - look, y - look, z)):
+                if neighbour in triangles:
+                    continue
+                new_sketch = sketch.get_copy()
+                new_sketch._triangles.add(neighbour)
+                if remaining > 1:
+                    stack.append((new_sketch, remaining - 1))
+                else:
+                    # Check if this is a new unique pattern
+                    key = new_sketch.canonical_key()
+                    if key not in seen_keys:
+                        seen_keys.add(key)
+                        patterns.append(new_sketch.get_centered())
+
+
+def _dump_pattern(pattern, file_path):
+    """Renders and saves a single pattern; helper for the process pool."""
+    pattern.dump_to_file(file_path)
 
 
 def main():
@@ -463,12 +568,14 @@ def main():
     num_triangles = int(input('Enter number of triangles: '))
     generate_patterns(patterns, num_triangles)
 
-    # Create output directory and save images
+    # Create output directory and save images; renders are independent and
+    # CPU-bound, so they are spread across worker processes
     work_path = Path('.')
     output_path = work_path / str(num_triangles)
     output_path.mkdir(exist_ok=True)
-    for i, pattern in enumerate(patterns):
-        pattern.dump_to_file(output_path / f'{num_triangles}_{i}.png')
+    file_paths = [output_path / f'{num_triangles}_{i}.png' for i in range(len(patterns))]
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_dump_pattern, patterns, file_paths))
 
 
 if __name__ == '__main__':